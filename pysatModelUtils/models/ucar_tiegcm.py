@@ -76,7 +76,8 @@ def init(self):
     return
 
 
-def load(fnames, tag=None, sat_id=None, **kwargs):
+def load(fnames, tag=None, sat_id=None, chunks=None, engine=None,
+         **kwargs):
     """Loads TIEGCM data using xarray.
 
     This routine is called as needed by pysat. It is not intended
@@ -93,6 +94,16 @@ def load(fnames, tag=None, sat_id=None, **kwargs):
     sat_id : string ('')
         Satellite ID used to identify particular data set to be loaded.
         This input is nominally provided by pysat itself.
+    chunks : int, dict, string, or NoneType
+        Dask chunk sizes for the data variables, e.g. a dict of chunk lengths
+        keyed by dimension name, or 'auto' to let dask pick the sizes.  An
+        empty dict uses one chunk per variable, or the on-disk chunking in
+        newer versions of xarray.  If None, dask is not used and xarray reads
+        each variable from disk when it is first accessed. (default=None)
+    engine : string or NoneType
+        xarray backend used to read the file, e.g. 'netcdf4' or 'h5netcdf'
+        for netCDF4/HDF5 output.  If None, xarray selects the backend.
+        (default=None)
     **kwargs : extra keywords
         Passthrough for additional keyword arguments specified when
         instantiating an Instrument object. These additional keywords
@@ -109,6 +120,15 @@ def load(fnames, tag=None, sat_id=None, **kwargs):
     Any additional keyword arguments passed to pysat.Instrument
     upon instantiation are passed along to this routine.
 
+    Setting chunks requires dask.  The data variables are then only read
+    from disk when computed, e.g. by calling `inst.data.load()`.
+
+    When more than one file is loaded, the files are combined along time.
+    Variables without a time dimension, such as the run parameters, must be
+    the same in every file and are kept once.  Without chunks, combining the
+    files reads the time-dependent variables into memory, while with chunks
+    they remain dask arrays.
+
     Examples
     --------
     ::
@@ -117,20 +137,26 @@ def load(fnames, tag=None, sat_id=None, **kwargs):
 
     """
 
-    # load data
-    data = xr.open_dataset(fnames[0])
+    # load data, combining multiple files along time.  Only variables with
+    # a time dimension are concatenated, the rest must match across files
+    data = xr.open_dataset(fnames[0], chunks=chunks, engine=engine)
+    if len(fnames) > 1:
+        data = xr.concat([data] + [xr.open_dataset(fname, chunks=chunks,
+                                                   engine=engine)
+                                   for fname in fnames[1:]],
+                         dim='time', data_vars='minimal', coords='minimal')
+
     # move attributes to the Meta object
     # these attributes will be trasnferred to the Instrument object
     # automatically by pysat
     meta = pysat.Meta()
-    for attr in data.attrs:
-        setattr(meta, attr[0], attr[1])
-    data.attrs = []
+    for attr, value in data.attrs.items():
+        setattr(meta, attr, value)
+    data.attrs = {}
 
     # fill Meta object with variable information
-    for key in data.variables.keys():
-        attrs = data.variables[key].attrs
-        meta[key] = attrs
+    for key, var in data.variables.items():
+        meta[key] = var.attrs
 
     # move misc parameters from xarray to the Instrument object via Meta
     # doing this after the meta ensures all metadata is still kept
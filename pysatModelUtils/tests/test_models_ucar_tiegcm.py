@@ -0,0 +1,105 @@
+from __future__ import absolute_import, unicode_literals
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import pysatModelUtils.models.ucar_tiegcm as ucar_tiegcm
+
+
+def write_tiegcm_file(fname, day):
+    """Write a small TIEGCM-style netCDF file with two times on one day
+
+    Parameters
+    ----------
+    fname : string
+        Full path of the file to write
+    day : string
+        Date of the model times, formatted as YYYY-MM-DD
+
+    """
+    times = np.datetime64('{:s}T00:00:00'.format(day)) + \
+        np.array([0, 3600]).astype('timedelta64[s]')
+    data = xr.Dataset({'tn': (('time', 'lat'), np.ones(shape=(2, 3))),
+                       'p0': 5.0e-4, 'p0_model': 5.0e-4, 'grav': 870.0,
+                       'mag': 1.0, 'timestep': 30},
+                      coords={'time': times, 'lat': [-45.0, 0.0, 45.0]},
+                      attrs={'model_name': 'TIEGCM',
+                             'run_label': 'pysatModelUtils test run'})
+    data.to_netcdf(fname)
+
+
+class TestModelsUcarTiegcmLoad():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.moved = ['p0', 'p0_model', 'grav', 'mag', 'timestep']
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.moved
+
+    def test_load_global_attrs(self, tmp_path):
+        """Move the global file attributes to Meta"""
+        fname = str(tmp_path / 'tiegcm_2019001.nc')
+        write_tiegcm_file(fname, '2019-01-01')
+
+        data, meta = ucar_tiegcm.load([fname])
+
+        assert meta.model_name == 'TIEGCM'
+        assert meta.run_label == 'pysatModelUtils test run'
+        assert data.attrs == {}
+
+    def test_load_run_parameters(self, tmp_path):
+        """Move the model run parameters from the data to Meta"""
+        fname = str(tmp_path / 'tiegcm_2019001.nc')
+        write_tiegcm_file(fname, '2019-01-01')
+
+        data, meta = ucar_tiegcm.load([fname])
+
+        for var in self.moved:
+            assert var not in data.variables
+        assert float(meta.p0) == 5.0e-4
+        assert float(meta.grav) == 870.0
+        assert int(meta.timestep) == 30
+
+    def test_load_multiple_files(self, tmp_path):
+        """Combine the data from files for two days along time"""
+        fnames = [str(tmp_path / 'tiegcm_2019001.nc'),
+                  str(tmp_path / 'tiegcm_2019002.nc')]
+        write_tiegcm_file(fnames[0], '2019-01-01')
+        write_tiegcm_file(fnames[1], '2019-01-02')
+
+        data, meta = ucar_tiegcm.load(fnames)
+
+        days = np.unique(data['time'].values.astype('datetime64[D]'))
+        assert list(days) == [np.datetime64('2019-01-01'),
+                              np.datetime64('2019-01-02')]
+        assert data['tn'].shape == (4, 3)
+        for var in self.moved:
+            assert var not in data.variables
+            assert getattr(meta, var).dims == ()
+        assert float(meta.p0) == 5.0e-4
+        assert float(meta.grav) == 870.0
+        assert int(meta.timestep) == 30
+
+    def test_load_engine(self, tmp_path):
+        """Load the data with an explicitly selected xarray backend"""
+        fname = str(tmp_path / 'tiegcm_2019001.nc')
+        write_tiegcm_file(fname, '2019-01-01')
+
+        data, meta = ucar_tiegcm.load([fname], engine='netcdf4')
+
+        assert data['tn'].shape == (2, 3)
+        assert np.all(data['tn'].values == 1.0)
+        assert list(data['lat'].values) == [-45.0, 0.0, 45.0]
+
+    def test_load_chunks(self, tmp_path):
+        """Load the data lazily as dask arrays"""
+        dask_array = pytest.importorskip('dask.array')
+        fname = str(tmp_path / 'tiegcm_2019001.nc')
+        write_tiegcm_file(fname, '2019-01-01')
+
+        data, meta = ucar_tiegcm.load([fname], chunks={})
+
+        assert isinstance(data['tn'].data, dask_array.Array)
+        assert np.all(data['tn'].values == 1.0)
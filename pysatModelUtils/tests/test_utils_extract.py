@@ -0,0 +1,113 @@
+from __future__ import absolute_import, unicode_literals
+
+import numpy as np
+from pytest import raises
+import xarray as xr
+
+import pysat
+
+import pysatModelUtils.utils.extract as extract
+
+
+class TestUtilsExtractMatchTimes():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.inst_times = np.datetime64('2009-01-01T00:00:00') + \
+            np.array([0, 10, 20, 30]).astype('timedelta64[s]')
+        self.min_del = 5.0
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.inst_times, self.min_del
+
+    def match_offsets(self, offsets):
+        """Match model times offset in seconds from the first instrument time
+        """
+        mod_times = self.inst_times[0] + \
+            np.array(offsets).astype('timedelta64[s]')
+        return extract._match_nearest_times(mod_times, self.inst_times,
+                                            self.min_del)
+
+    def test_match_before_first_inst_time(self):
+        """Match a model time before the first instrument time"""
+        mind, iind = self.match_offsets([-5])
+
+        assert mind == [0]
+        assert iind == [0]
+
+    def test_match_after_last_inst_time(self):
+        """Match a model time after the last instrument time"""
+        mind, iind = self.match_offsets([34])
+
+        assert mind == [0]
+        assert iind == [3]
+
+    def test_match_closest_inst_time(self):
+        """Match model times to the closest of two instrument times"""
+        mind, iind = self.match_offsets([12, 18])
+
+        assert mind == [0, 1]
+        assert iind == [1, 2]
+
+    def test_match_tie_uses_earlier_inst_time(self):
+        """Match a model time halfway between two instrument times"""
+        mind, iind = self.match_offsets([5, 25])
+
+        assert mind == [0, 1]
+        assert iind == [0, 2]
+
+    def test_match_drops_distant_model_time(self):
+        """Drop model times further than min_del from any instrument time"""
+        mind, iind = self.match_offsets([-10, 15, 100])
+
+        assert mind == [1]
+        assert iind == [1]
+
+    def test_match_repeated_inst_time(self):
+        """Match the first copy of a repeated instrument time"""
+        self.inst_times = np.datetime64('2009-01-01T00:00:00') + \
+            np.array([0, 10, 10, 20]).astype('timedelta64[s]')
+        mind, iind = self.match_offsets([8, 12])
+
+        assert mind == [0, 1]
+        assert iind == [1, 1]
+
+    def test_match_no_inst_times(self):
+        """Find no matches without any instrument times"""
+        mind, iind = extract._match_nearest_times(self.inst_times[:2],
+                                                  self.inst_times[:0],
+                                                  self.min_del)
+
+        assert mind == []
+        assert iind == []
+
+
+class TestUtilsExtractModelledObservations():
+    def setup(self):
+        """Runs before every method to create a clean testing setup."""
+        self.testInst = pysat.Instrument(platform=str('pysat'),
+                                         name=str('testing'),
+                                         clean_level='clean')
+        self.testInst.load(date=pysat.datetime(2009, 1, 1))
+        times = np.datetime64('2009-01-01T00:00:00') + \
+            np.array([0, 900]).astype('timedelta64[s]')
+        self.model = xr.Dataset({'dummy': (('time', 'lon'),
+                                           np.zeros(shape=(2, 2)))},
+                                coords={'time': times, 'lon': [0.0, 360.0]})
+        self.model['model_time'] = self.model['time']
+
+    def teardown(self):
+        """Runs after every method to clean up previous testing."""
+        del self.testInst, self.model
+
+    def test_extract_modelled_observations_unsorted_inst(self):
+        """Try to run with instrument times out of order"""
+        self.testInst.data = self.testInst.data.iloc[::-1]
+
+        with raises(ValueError) as verr:
+            extract.extract_modelled_observations(
+                inst=self.testInst, model=self.model,
+                inst_name=['longitude'], mod_name=['lon'], mod_units=['deg'],
+                mod_datetime_name='model_time', mod_time_name='time')
+
+        assert verr.value.args[0].find('Instrument times must be sorted') >= 0
@@ -0,0 +1,37 @@
+from __future__ import absolute_import, unicode_literals
+
+import subprocess
+import sys
+
+import pytest
+
+import pysatModelUtils.utils as utils
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='lazy submodule imports require Python 3.7+')
+class TestUtilsLazyImport():
+    def test_import_does_not_load_compare(self):
+        """Import pysatModelUtils without importing the compare utilities"""
+        cmd = ''.join(['import sys, pysatModelUtils; ',
+                       'print("pysatModelUtils.utils.compare" in ',
+                       'sys.modules)'])
+        out = subprocess.check_output([sys.executable, '-c', cmd])
+
+        assert out.decode().strip() == 'False'
+
+    def test_dir_lists_submodules(self):
+        """List each lazily imported submodule once in dir"""
+        utils.extract
+
+        for name in ['extract', 'match', 'compare']:
+            assert dir(utils).count(name) == 1
+
+    def test_unknown_attribute(self):
+        """Raise the standard AttributeError for unknown attributes"""
+        with pytest.raises(AttributeError) as aerr:
+            utils.not_a_utility
+
+        assert aerr.value.args[0] == ''.join(["module 'pysatModelUtils.utils'",
+                                              " has no attribute ",
+                                              "'not_a_utility'"])
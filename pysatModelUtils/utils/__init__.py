@@ -13,6 +13,28 @@ Utilities designed to extract, match, and compare modelled and observed data
 
 from __future__ import absolute_import,  unicode_literals
 
-from . import (extract)
-from . import (match)
-from . import (compare)
+import sys
+
+__all__ = ['extract', 'match', 'compare']
+
+if sys.version_info >= (3, 7):
+    # Import the submodules on first access (PEP 562), so that importing the
+    # package does not require the dependencies of every utility, such as
+    # PyForecastTools for compare
+    import importlib
+
+    def __getattr__(name):
+        if name in __all__:
+            module = importlib.import_module('.{:s}'.format(name), __name__)
+            globals()[name] = module
+            return module
+
+        raise AttributeError("module '{:s}' has no attribute '{:s}'".format(
+            __name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    from . import (extract)
+    from . import (match)
+    from . import (compare)
@@ -148,6 +148,9 @@ def extract_modelled_observations(inst=None, model=None, inst_name=[],
         raise ValueError('Must provide units for each model location ' +
                          'attribute')
 
+    if not inst.index.is_monotonic_increasing:
+        raise ValueError('Instrument times must be sorted in increasing order')
+
     inst_scale = np.ones(shape=len(inst_name), dtype=float)
     for i, ii in enumerate(inst_name):
         if ii not in list(inst.data.keys()):
@@ -174,13 +177,8 @@ def extract_modelled_observations(inst=None, model=None, inst_name=[],
 
     # Determine which instrument observations are within the model time
     # resolution of a model run
-    mind = list()
-    iind = list()
-    for i, tt in enumerate(np.array(model.data_vars[mod_datetime_name])):
-        del_sec = abs(tt - inst.index).total_seconds()
-        if del_sec.min() <= min_del:
-            iind.append(del_sec.argmin())
-            mind.append(i)
+    mind, iind = _match_nearest_times(model.data_vars[mod_datetime_name],
+                                      inst.index.values, min_del)
 
     # Determine the model coordinates closest to the satellite track
     interp_data = dict()
@@ -314,4 +312,51 @@ def extract_modelled_observations(inst=None, model=None, inst_name=[],
 
     return interp_data.keys()
 
-                  
+
+def _match_nearest_times(mod_times, inst_times, min_del):
+    """Find the closest instrument time to each model time
+
+    Parameters
+    ----------
+    mod_times : array-like
+        Model datetimes
+    inst_times : array-like
+        Instrument datetimes, sorted in increasing order
+    min_del : float
+        Maximum separation in seconds between matched model and instrument
+        times
+
+    Returns
+    -------
+    mind : list of ints
+        Indices of the model times that have a matching instrument time
+    iind : list of ints
+        Indices of the closest instrument time for each model time in mind
+
+    Notes
+    -----
+    The closest instrument time is one of the two neighbours found by a
+    binary search.  If both are equally close, the earlier one is used, and
+    the first of any repeated instrument times is returned.
+
+    """
+    mod_times = np.asarray(mod_times, dtype='datetime64[ns]')
+    inst_times = np.asarray(inst_times, dtype='datetime64[ns]')
+
+    if len(inst_times) == 0:
+        return list(), list()
+
+    # Both neighbours point to the first copy of any repeated instrument time
+    iright = np.searchsorted(inst_times, mod_times)
+    ileft = np.clip(iright - 1, 0, len(inst_times) - 1)
+    ileft = np.searchsorted(inst_times, inst_times[ileft])
+    iright = np.clip(iright, 0, len(inst_times) - 1)
+    del_left = abs(mod_times - inst_times[ileft]) / np.timedelta64(1, 's')
+    del_right = abs(inst_times[iright] - mod_times) / np.timedelta64(1, 's')
+    iclose = np.where(del_right < del_left, iright, ileft)
+    del_sec = np.minimum(del_left, del_right)
+
+    mind = list(np.where(del_sec <= min_del)[0])
+    iind = list(iclose[mind])
+
+    return mind, iind